@@ -27,7 +27,7 @@ from logging.config import fileConfig
 
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import async_engine_from_config
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from alembic import context
 
@@ -91,15 +91,12 @@ async def run_async_migrations() -> None:
     """
     Run migrations in 'online' mode with async engine.
     
-    🎓 INTERVIEW: Note we use async_engine_from_config
-    because our app uses async SQLAlchemy.
+    🎓 INTERVIEW: Note we use an async engine because our app
+    uses async SQLAlchemy. It's built straight from settings with
+    NullPool: a migration run is one-shot, so pooling buys nothing.
     """
-    configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = settings.DATABASE_URL
-    
-    connectable = async_engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
+    connectable = create_async_engine(
+        settings.DATABASE_URL,
         poolclass=pool.NullPool,
     )
 
@@ -14,24 +14,46 @@ This is suitable for first-party apps where you trust
 the client with the user's credentials.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.dependencies import user_active_cache
 from app.core.security import (
     hash_password,
     verify_password,
+    verify_and_update_password,
     create_access_token,
     create_refresh_token,
     decode_token,
+    has_token_type,
 )
 from app.models import User
 from app.schemas import UserCreate, UserResponse, Token
 
 router = APIRouter()
 
+# Hot-path statements built once at import; values are bound per call
+# 🎓 INTERVIEW: SQLAlchemy already caches the compiled SQL, but building
+# the Select tree itself still allocates. Reusing it skips that work.
+_GET_LOGIN_BY_EMAIL = select(User.id, User.hashed_password, User.is_active).where(
+    User.email == bindparam("email")
+)  # Only the columns login needs - all covered by ix_users_email_cover
+_SET_PASSWORD_HASH = (
+    update(User)
+    .where(User.id == bindparam("user_id"))
+    .values(hashed_password=bindparam("hashed_password"))
+)
+_GET_USER_ACTIVE_BY_ID = select(User.is_active).where(User.id == bindparam("user_id"))
+
+# Hash verified against when the login email doesn't exist, so both
+# branches pay the same hashing cost (see login() docstring)
+_DUMMY_HASH = hash_password("x" * 12)
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -45,6 +67,7 @@ async def register(
     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     We check for existing email/username BEFORE attempting insert.
     This provides a better error message than a DB constraint violation.
+    Both columns are checked with one OR query (one round trip).
     
     However, there's a race condition:
     - Thread 1: Check email -> not found
@@ -55,21 +78,26 @@ async def register(
     The DB unique constraint is our safety net.
     For high-traffic systems, consider pessimistic locking.
     """
-    # Check if email already exists
+    # Check for existing email or username in a single round trip
+    # (cheaper than gathering two SELECTs, which would also need two
+    # sessions since an AsyncSession can't run queries concurrently)
     result = await db.execute(
-        select(User).where(User.email == user_data.email)
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
+        select(User.id, User.email, User.username)
+        .where(
+            or_(
+                User.email == user_data.email,
+                User.username == user_data.username,
+            )
         )
-    
-    # Check if username already exists
-    result = await db.execute(
-        select(User).where(User.username == user_data.username)
+        .limit(1)
     )
-    if result.scalar_one_or_none():
+    existing = result.first()
+    if existing:
+        if existing.email == user_data.email:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken",
@@ -77,16 +105,22 @@ async def register(
     
     # Create new user
     # 🎓 INTERVIEW: Never store plain passwords!
-    user = User(
-        email=user_data.email,
-        username=user_data.username,
-        full_name=user_data.full_name,
-        hashed_password=hash_password(user_data.password),
-    )
+    hashed_password = await asyncio.to_thread(hash_password, user_data.password)
     
-    db.add(user)
+    # RETURNING hands back server-generated fields (id, created_at)
+    # from the INSERT itself, so no refresh SELECT is needed.
+    result = await db.execute(
+        insert(User)
+        .values(
+            email=user_data.email,
+            username=user_data.username,
+            full_name=user_data.full_name,
+            hashed_password=hashed_password,
+        )
+        .returning(User)
+    )
+    user = result.scalar_one()
     await db.commit()
-    await db.refresh(user)
     
     return user
 
@@ -112,12 +146,18 @@ async def login(
     
     This is called "user enumeration" and it's a security risk.
     Always return the same error for both cases.
+    
+    The same goes for response TIME: hashing is slow, so an
+    unknown email must still run a verify (against a dummy hash),
+    otherwise the fast reply gives the answer away.
+    
+    Hashes from before the switch to argon2id are bcrypt, which is
+    much slower to verify than the argon2id dummy - so they'd stand
+    out too. A successful login rehashes them with argon2id.
     """
     # OAuth2PasswordRequestForm uses 'username' field, but we use email
-    result = await db.execute(
-        select(User).where(User.email == form_data.username)
-    )
-    user = result.scalar_one_or_none()
+    result = await db.execute(_GET_LOGIN_BY_EMAIL, {"email": form_data.username})
+    user = result.one_or_none()  # Row(id, hashed_password, is_active)
     
     # Generic error message for both invalid email and password
     invalid_credentials = HTTPException(
@@ -126,12 +166,22 @@ async def login(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    if not user:
+    if user is None:
+        await asyncio.to_thread(verify_password, form_data.password, _DUMMY_HASH)
         raise invalid_credentials
     
-    if not verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = await asyncio.to_thread(
+        verify_and_update_password, form_data.password, user.hashed_password
+    )
+    if not verified:
         raise invalid_credentials
     
+    if new_hash is not None:
+        await db.execute(
+            _SET_PASSWORD_HASH, {"user_id": user.id, "hashed_password": new_hash}
+        )
+        await db.commit()
+    
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -164,9 +214,9 @@ async def refresh_token(
     This is called "token rotation" and limits the damage if
     a refresh token is stolen.
     """
-    payload = decode_token(refresh_token)
+    payload = decode_token(refresh_token)  # Cached; see security.decode_token
     
-    if payload is None or payload.get("type") != "refresh":
+    if payload is None or not has_token_type(payload, "refresh"):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
@@ -180,12 +230,14 @@ async def refresh_token(
         )
     
     # Verify user still exists and is active
-    result = await db.execute(
-        select(User).where(User.id == int(user_id))
-    )
-    user = result.scalar_one_or_none()
-    
-    if not user or not user.is_active:
+    # (cached for chatty refresh clients; see dependencies.user_active_cache)
+    is_active = user_active_cache.get(user_id)
+    if is_active is None:
+        result = await db.execute(_GET_USER_ACTIVE_BY_ID, {"user_id": user_id})
+        is_active = bool(result.scalar_one_or_none())  # None = no such user
+        user_active_cache[user_id] = is_active
+    
+    if not is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
@@ -193,6 +245,6 @@ async def refresh_token(
     
     # Issue new tokens
     return Token(
-        access_token=create_access_token(subject=user.id),
-        refresh_token=create_refresh_token(subject=user.id),
+        access_token=create_access_token(subject=user_id),
+        refresh_token=create_refresh_token(subject=user_id),
     )
@@ -13,11 +13,15 @@ Plus nested resource operations:
 - POST /routines/{id}/exercises
 - PATCH /routines/{id}/exercises/{exercise_id}
 - DELETE /routines/{id}/exercises/{exercise_id}
+- PUT /routines/{id}/exercises
+- PUT /routines/{id}/exercises/order
 """
 
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import JSON, bindparam, delete, func, insert, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload, undefer
 
 from app.core.dependencies import CurrentUser, DbSession
 from app.models import Routine, RoutineExercise, DayOfWeek
@@ -29,10 +33,106 @@ from app.schemas import (
     RoutineExerciseCreate,
     RoutineExerciseUpdate,
     RoutineExerciseResponse,
+    RoutineExerciseUpsert,
+    ExerciseOrder,
 )
+from app.services.routine_service import reorder_exercises, replace_exercises
 
 router = APIRouter()
 
+# Hot-path statements built once at import; values are bound per call
+_LIST_ROUTINES = (
+    select(
+        Routine.id,
+        Routine.name,
+        Routine.description,
+        Routine.day_of_week,
+        Routine.created_at,
+        func.count(RoutineExercise.id).label("exercise_count"),
+    )
+    .outerjoin(RoutineExercise, RoutineExercise.routine_id == Routine.id)
+    .where(Routine.user_id == bindparam("user_id"))
+    .group_by(Routine.id)
+    .order_by(Routine.day_of_week, Routine.name)
+)
+_LIST_ROUTINES_FOR_DAY = _LIST_ROUTINES.where(
+    Routine.day_of_week == bindparam("day_of_week")
+)
+_GET_OWNED_EXERCISE = (
+    select(RoutineExercise)
+    .options(undefer(RoutineExercise.notes))
+    .join(Routine, Routine.id == RoutineExercise.routine_id)
+    .where(
+        RoutineExercise.id == bindparam("exercise_id"),
+        RoutineExercise.routine_id == bindparam("routine_id"),
+        Routine.user_id == bindparam("user_id"),
+    )
+)
+
+# description/notes are deferred columns; responses that show them
+# must undefer them (async code can't lazy-load on attribute access)
+_ROUTINE_DETAIL_OPTIONS = [
+    undefer(Routine.description),
+    selectinload(Routine.exercises).undefer(RoutineExercise.notes),
+]
+
+# Postgres: a routine and its exercises in ONE query, with the exercises
+# aggregated server-side into a JSON array (in display order). Keys are
+# bound parameters, taken from the response schema so they can't drift.
+_EXERCISE_JSON = func.json_build_object(
+    *(
+        arg
+        for name in RoutineExerciseResponse.model_fields
+        for arg in (literal(name), getattr(RoutineExercise, name))
+    )
+)
+_GET_ROUTINE_NESTED = (
+    select(
+        Routine.id,
+        Routine.user_id,
+        Routine.name,
+        Routine.description,
+        Routine.day_of_week,  # Plain column, so it's decoded by its own type
+        Routine.created_at,
+        Routine.updated_at,
+        func.coalesce(
+            func.json_agg(
+                aggregate_order_by(_EXERCISE_JSON, RoutineExercise.order)
+            ).filter(RoutineExercise.id.isnot(None)),  # LEFT JOIN found none
+            literal_column("'[]'::json"),
+            type_=JSON,
+        ).label("exercises"),
+    )
+    .outerjoin(RoutineExercise, RoutineExercise.routine_id == Routine.id)
+    .where(
+        Routine.id == bindparam("routine_id"),
+        Routine.user_id == bindparam("user_id"),
+    )
+    .group_by(Routine.id)
+)
+
+_DAY_CONFLICT_INDEX = "ux_routines_user_day"
+
+
+def _is_day_conflict(exc: IntegrityError) -> bool:
+    """True if exc violated the one-routine-per-day unique index."""
+    # asyncpg reports the violated constraint by name
+    constraint = getattr(exc.orig.__cause__, "constraint_name", None)
+    if constraint is not None:
+        return constraint == _DAY_CONFLICT_INDEX
+    # SQLite only gives a message, naming the columns of the index
+    return "routines.user_id, routines.day_of_week" in str(exc.orig)
+
+
+def _day_taken(day_of_week: DayOfWeek | None) -> HTTPException:
+    """409 for a violation of the one-routine-per-day unique index."""
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"A routine is already scheduled for {day_of_week.value}"
+        if day_of_week
+        else "Routine conflicts with an existing routine",
+    )
+
 
 @router.post("/", response_model=RoutineResponse, status_code=status.HTTP_201_CREATED)
 async def create_routine(
@@ -53,6 +153,10 @@ async def create_routine(
     
     This is the ACID property "Atomicity":
     All or nothing. Either everything succeeds or nothing does.
+    
+    A user can schedule one routine per day. The unique index on
+    (user_id, day_of_week) checks that during the INSERT itself,
+    so there's no SELECT-then-INSERT (and no race between them).
     """
     # Create routine
     routine = Routine(
@@ -62,25 +166,55 @@ async def create_routine(
         day_of_week=routine_data.day_of_week,
     )
     db.add(routine)
-    await db.flush()  # Get routine.id without committing
+    try:
+        await db.flush()  # Get routine.id (and server timestamps) without committing
+    except IntegrityError as exc:
+        if not _is_day_conflict(exc):
+            raise
+        raise _day_taken(routine_data.day_of_week) from exc
     
     # Create exercises
-    for i, exercise_data in enumerate(routine_data.exercises):
-        exercise = RoutineExercise(
-            routine_id=routine.id,
-            exercise_name=exercise_data.exercise_name,
-            target_sets=exercise_data.target_sets,
-            target_reps=exercise_data.target_reps,
-            target_weight=exercise_data.target_weight,
-            order=exercise_data.order if exercise_data.order else i,
-            notes=exercise_data.notes,
+    # 🎓 INTERVIEW: One executemany INSERT instead of one INSERT per
+    # exercise - a single round trip regardless of exercise count.
+    # RETURNING gives us the created rows, so no refresh is needed.
+    exercises = []
+    if routine_data.exercises:
+        result = await db.execute(
+            insert(RoutineExercise)
+            .returning(RoutineExercise, sort_by_parameter_order=True)
+            .options(undefer(RoutineExercise.notes)),
+            [
+                {
+                    "routine_id": routine.id,
+                    "exercise_name": exercise_data.exercise_name,
+                    "target_sets": exercise_data.target_sets,
+                    "target_reps": exercise_data.target_reps,
+                    "target_weight": exercise_data.target_weight,
+                    "order": exercise_data.order if exercise_data.order else i,
+                    "notes": exercise_data.notes,
+                }
+                for i, exercise_data in enumerate(routine_data.exercises)
+            ],
         )
-        db.add(exercise)
+        exercises = sorted(result.scalars().all(), key=lambda e: e.order)
     
     await db.commit()
-    await db.refresh(routine)
     
-    return routine
+    # Every value is already known, so build the response directly
+    # instead of re-SELECTing the routine and its exercises
+    return RoutineResponse(
+        id=routine.id,
+        user_id=routine.user_id,
+        name=routine.name,
+        description=routine.description,
+        day_of_week=routine.day_of_week,
+        created_at=routine.created_at,
+        updated_at=routine.updated_at,
+        exercises=[
+            RoutineExerciseResponse.model_validate(exercise)
+            for exercise in exercises
+        ],
+    )
 
 
 @router.get("/", response_model=list[RoutineListResponse])
@@ -102,34 +236,18 @@ async def list_routines(
     3. N+1 query problem: Loading exercises for each routine
        would be O(n) queries. Better to eager load when needed.
     
-    We add exercise_count as a computed field for the UI.
+    We add exercise_count as a computed field for the UI, counted
+    in SQL with LEFT JOIN + GROUP BY so the whole list is one query.
     """
-    query = select(Routine).where(Routine.user_id == current_user.id)
-    
     if day_of_week:
-        query = query.where(Routine.day_of_week == day_of_week)
-    
-    query = query.order_by(Routine.day_of_week, Routine.name)
-    
-    result = await db.execute(query)
-    routines = result.scalars().all()
-    
-    # Add exercise count
-    # 🎓 INTERVIEW: This could be optimized with a SQL subquery
-    # to get counts in a single query. For now, we use lazy loading.
-    response = []
-    for routine in routines:
-        routine_dict = {
-            "id": routine.id,
-            "name": routine.name,
-            "description": routine.description,
-            "day_of_week": routine.day_of_week,
-            "created_at": routine.created_at,
-            "exercise_count": len(routine.exercises),
-        }
-        response.append(RoutineListResponse(**routine_dict))
+        result = await db.execute(
+            _LIST_ROUTINES_FOR_DAY,
+            {"user_id": current_user.id, "day_of_week": day_of_week},
+        )
+    else:
+        result = await db.execute(_LIST_ROUTINES, {"user_id": current_user.id})
     
-    return response
+    return result.all()
 
 
 @router.get("/{routine_id}", response_model=RoutineResponse)
@@ -155,15 +273,34 @@ async def get_routine(
     Alternative strategies:
     - joinedload: Single query with JOIN (good for one-to-one)
     - subqueryload: Subquery (good for large child collections)
+    
+    🎓 INTERVIEW: db.get() is a primary-key lookup that checks the
+    session's identity map first, so a routine already loaded in this
+    session costs no SQL at all. Ownership is then checked in Python.
+    
+    On Postgres we go one better: json_agg() folds the exercises into
+    the routine row, so it's one round trip and no ORM objects at all.
     """
-    result = await db.execute(
-        select(Routine)
-        .options(selectinload(Routine.exercises))
-        .where(Routine.id == routine_id, Routine.user_id == current_user.id)
+    if db.bind.dialect.name == "postgresql":
+        result = await db.execute(
+            _GET_ROUTINE_NESTED,
+            {"routine_id": routine_id, "user_id": current_user.id},
+        )
+        row = result.first()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Routine not found",
+            )
+        return row._asdict()
+    
+    routine = await db.get(
+        Routine,
+        routine_id,
+        options=_ROUTINE_DETAIL_OPTIONS,
     )
-    routine = result.scalar_one_or_none()
     
-    if not routine:
+    if routine is None or routine.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Routine not found",
@@ -183,26 +320,37 @@ async def update_routine(
     Update a routine's metadata (not exercises).
     
     Use the exercise-specific endpoints to modify exercises.
+    
+    Exercises are untouched here, and updated_at (set by the DB)
+    is fetched back during the flush itself (eager_defaults on
+    Routine), so nothing is re-SELECTed after the commit.
+    An empty PATCH writes nothing.
     """
-    result = await db.execute(
-        select(Routine)
-        .options(selectinload(Routine.exercises))
-        .where(Routine.id == routine_id, Routine.user_id == current_user.id)
+    # Exercises are loaded up front because the response includes them
+    routine = await db.get(
+        Routine,
+        routine_id,
+        options=_ROUTINE_DETAIL_OPTIONS,
     )
-    routine = result.scalar_one_or_none()
     
-    if not routine:
+    if routine is None or routine.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Routine not found",
         )
     
     update_data = routine_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(routine, field, value)
-    
-    await db.commit()
-    await db.refresh(routine)
+    if update_data:
+        for field, value in update_data.items():
+            setattr(routine, field, value)
+        routine.updated_at = func.now()  # Evaluated by the DB in the UPDATE
+        
+        try:
+            await db.commit()
+        except IntegrityError as exc:
+            if not _is_day_conflict(exc):
+                raise
+            raise _day_taken(update_data.get("day_of_week")) from exc
     
     return routine
 
@@ -218,22 +366,25 @@ async def delete_routine(
     
     🎓 INTERVIEW: Cascade delete ensures exercises are
     automatically deleted when the routine is deleted.
+    
+    We issue a single DELETE ... WHERE id AND user_id and use
+    rowcount to tell 204 from 404, instead of SELECT-then-delete.
+    That bypasses the ORM cascade, so the ON DELETE CASCADE on
+    routine_exercises.routine_id does the work at the DB level.
     """
     result = await db.execute(
-        select(Routine).where(
+        delete(Routine).where(
             Routine.id == routine_id,
             Routine.user_id == current_user.id,
         )
     )
-    routine = result.scalar_one_or_none()
     
-    if not routine:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Routine not found",
         )
     
-    await db.delete(routine)
     await db.commit()
 
 
@@ -269,42 +420,120 @@ async def add_exercise_to_routine(
     authorization easier (verify routine ownership once).
     """
     # Verify routine exists and belongs to user
+    routine = await db.get(Routine, routine_id)
+    
+    if routine is None or routine.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Routine not found",
+        )
+    
+    # Append at end: compute MAX(order) + 1 inside the INSERT itself
+    # 🎓 INTERVIEW: Pushing the lookup into the statement saves a round
+    # trip and narrows the window where two concurrent adds could read
+    # the same max and pick the same order.
+    if exercise_data.order:
+        order = exercise_data.order
+    else:
+        order = (
+            select(func.coalesce(func.max(RoutineExercise.order), -1) + 1)
+            .where(RoutineExercise.routine_id == routine_id)
+            .scalar_subquery()
+        )
+    
     result = await db.execute(
-        select(Routine).where(
-            Routine.id == routine_id,
-            Routine.user_id == current_user.id,
+        insert(RoutineExercise)
+        .values(
+            routine_id=routine_id,
+            exercise_name=exercise_data.exercise_name,
+            target_sets=exercise_data.target_sets,
+            target_reps=exercise_data.target_reps,
+            target_weight=exercise_data.target_weight,
+            order=order,
+            notes=exercise_data.notes,
         )
+        .returning(RoutineExercise)
+        .options(undefer(RoutineExercise.notes))
     )
-    routine = result.scalar_one_or_none()
+    exercise = result.scalar_one()
+    await db.commit()
     
-    if not routine:
+    return exercise
+
+
+@router.put(
+    "/{routine_id}/exercises",
+    response_model=list[RoutineExerciseResponse],
+)
+async def replace_routine_exercises(
+    routine_id: int,
+    exercises: list[RoutineExerciseUpsert],
+    current_user: CurrentUser,
+    db: DbSession,
+):
+    """
+    Replace a routine's full exercise list (e.g. after an edit screen).
+    
+    Entries with an id are updated, entries without one are created,
+    and anything not listed is removed - see
+    services/routine_service.replace_exercises. An id that isn't one
+    of this routine's exercises is a 404, and nothing is changed.
+    """
+    routine = await db.get(Routine, routine_id)
+    
+    if routine is None or routine.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Routine not found",
         )
     
-    # Get max order to append at end
+    try:
+        await replace_exercises(db, routine_id, exercises)
+    except LookupError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Exercise not found",
+        ) from exc
+    
     result = await db.execute(
-        select(func.max(RoutineExercise.order))
+        select(RoutineExercise)
+        .options(undefer(RoutineExercise.notes))
         .where(RoutineExercise.routine_id == routine_id)
+        .order_by(RoutineExercise.order)
     )
-    max_order = result.scalar() or -1
-    
-    exercise = RoutineExercise(
-        routine_id=routine_id,
-        exercise_name=exercise_data.exercise_name,
-        target_sets=exercise_data.target_sets,
-        target_reps=exercise_data.target_reps,
-        target_weight=exercise_data.target_weight,
-        order=exercise_data.order if exercise_data.order else max_order + 1,
-        notes=exercise_data.notes,
-    )
-    
-    db.add(exercise)
+    updated = result.scalars().all()
     await db.commit()
-    await db.refresh(exercise)
     
-    return exercise
+    return updated
+
+
+@router.put(
+    "/{routine_id}/exercises/order",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def reorder_routine_exercises(
+    routine_id: int,
+    new_order: list[ExerciseOrder],
+    current_user: CurrentUser,
+    db: DbSession,
+):
+    """
+    Reorder many exercises at once (drag-and-drop).
+    
+    All rows are updated by one executemany UPDATE; see
+    services/routine_service.py. Ids that don't belong to this
+    routine are ignored.
+    """
+    routine = await db.get(Routine, routine_id)
+    
+    if routine is None or routine.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Routine not found",
+        )
+    
+    await reorder_exercises(db, routine_id, [(e.id, e.order) for e in new_order])
+    await db.commit()
 
 
 @router.patch(
@@ -319,25 +548,16 @@ async def update_exercise(
     db: DbSession,
 ):
     """Update an exercise within a routine."""
-    # Verify routine ownership
-    result = await db.execute(
-        select(Routine).where(
-            Routine.id == routine_id,
-            Routine.user_id == current_user.id,
-        )
-    )
-    if not result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Routine not found",
-        )
-    
-    # Get exercise
+    # Get exercise, verifying routine ownership in the same query
+    # 🎓 INTERVIEW: A missing exercise and someone else's routine both
+    # return 404, so callers can't probe for other users' routines.
     result = await db.execute(
-        select(RoutineExercise).where(
-            RoutineExercise.id == exercise_id,
-            RoutineExercise.routine_id == routine_id,
-        )
+        _GET_OWNED_EXERCISE,
+        {
+            "exercise_id": exercise_id,
+            "routine_id": routine_id,
+            "user_id": current_user.id,
+        },
     )
     exercise = result.scalar_one_or_none()
     
@@ -351,8 +571,9 @@ async def update_exercise(
     for field, value in update_data.items():
         setattr(exercise, field, value)
     
+    # No refresh: every changed value was set here, and none of these
+    # columns have server-side defaults
     await db.commit()
-    await db.refresh(exercise)
     
     return exercise
 
@@ -368,33 +589,21 @@ async def delete_exercise(
     db: DbSession,
 ):
     """Delete an exercise from a routine."""
-    # Verify routine ownership
+    # Single DELETE; ownership checked via subquery on the user's routines
     result = await db.execute(
-        select(Routine).where(
-            Routine.id == routine_id,
-            Routine.user_id == current_user.id,
-        )
-    )
-    if not result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Routine not found",
-        )
-    
-    # Get and delete exercise
-    result = await db.execute(
-        select(RoutineExercise).where(
+        delete(RoutineExercise).where(
             RoutineExercise.id == exercise_id,
             RoutineExercise.routine_id == routine_id,
+            RoutineExercise.routine_id.in_(
+                select(Routine.id).where(Routine.user_id == current_user.id)
+            ),
         )
     )
-    exercise = result.scalar_one_or_none()
     
-    if not exercise:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Exercise not found",
         )
     
-    await db.delete(exercise)
     await db.commit()
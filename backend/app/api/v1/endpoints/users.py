@@ -12,10 +12,14 @@ The /me endpoint is a common pattern for "current user"
 operations without needing to know the user ID.
 """
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, status
+from sqlalchemy import update
 
-from app.core.dependencies import CurrentUser, DbSession
+from app.core.dependencies import CurrentUser, DbSession, invalidate_user
 from app.core.security import hash_password
+from app.models import User
 from app.schemas import UserResponse, UserUpdate
 
 router = APIRouter()
@@ -55,6 +59,9 @@ async def update_current_user(
     Example:
         Request: {"full_name": "John"}
         Result: Only full_name is updated, other fields unchanged
+    
+    The provided fields go straight into one UPDATE ... RETURNING,
+    which skips the ORM dirty-tracking flush and the refresh SELECT.
     """
     # Get only fields that were explicitly provided
     update_data = user_update.model_dump(exclude_unset=True)
@@ -67,16 +74,23 @@ async def update_current_user(
     
     # Handle password separately (needs hashing)
     if "password" in update_data:
-        update_data["hashed_password"] = hash_password(update_data.pop("password"))
+        update_data["hashed_password"] = await asyncio.to_thread(
+            hash_password, update_data.pop("password")
+        )
     
     # Update user fields
-    for field, value in update_data.items():
-        setattr(current_user, field, value)
-    
+    result = await db.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(**update_data)
+        .returning(User)
+        .execution_options(populate_existing=True)
+    )
+    user = result.scalar_one()
     await db.commit()
-    await db.refresh(current_user)
+    invalidate_user(user.id)
     
-    return current_user
+    return user
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
@@ -93,8 +107,9 @@ async def delete_current_user(
     the User relationships, deleting a user automatically
     deletes their routines, logs, etc.
     
-    This is handled at the ORM level. Alternatively, you
-    could use ON DELETE CASCADE at the database level.
+    The relationships also set passive_deletes=True, so the ORM
+    leaves the actual work to ON DELETE CASCADE at the database
+    level instead of loading every routine and log first.
     
     For some apps, you might want "soft delete" instead:
     - Set is_active=False
@@ -103,3 +118,4 @@ async def delete_current_user(
     """
     await db.delete(current_user)
     await db.commit()
+    invalidate_user(current_user.id)
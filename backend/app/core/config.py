@@ -14,7 +14,10 @@ This follows the "12-Factor App" methodology for config:
 - Strict separation of config from code
 """
 
-from functools import lru_cache
+import json
+from functools import cached_property, lru_cache
+
+from pydantic import AliasChoices, Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -52,7 +55,30 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379/0"
     
     # CORS (for mobile app)
-    CORS_ORIGINS: list[str] = ["*"]  # Restrict in production
+    # Comma-separated, e.g. "https://a.example,https://b.example".
+    # Read from the CORS_ORIGINS env var; the old JSON list form
+    # ('["https://a.example"]') is still accepted.
+    CORS_ORIGINS_RAW: str = Field(
+        default="*",  # Restrict in production
+        validation_alias=AliasChoices("CORS_ORIGINS", "CORS_ORIGINS_RAW"),
+    )
+    
+    @computed_field
+    @cached_property
+    def CORS_ORIGIN_LIST(self) -> tuple[str, ...]:
+        """
+        Allowed origins parsed from CORS_ORIGINS_RAW.
+        
+        A plain string env var avoids JSON-decoding a list on every
+        Settings() construction; the tuple is parsed once and is
+        immutable, so it's safe to share.
+        """
+        raw = self.CORS_ORIGINS_RAW.strip()
+        if raw.startswith("["):
+            origins = json.loads(raw)
+        else:
+            origins = raw.split(",")
+        return tuple(origin.strip() for origin in origins if origin.strip())
     
     model_config = SettingsConfigDict(
         env_file=".env",
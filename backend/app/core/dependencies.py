@@ -15,21 +15,49 @@ FastAPI's DI system provides:
 - Clear separation of concerns
 """
 
-from typing import Annotated
+from typing import Annotated, Any
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, make_transient_to_detached
 
 from app.core.database import get_db
-from app.core.security import decode_token
+from app.core.security import decode_token, has_token_type
 from app.models import User
 
 # OAuth2 scheme - extracts Bearer token from Authorization header
 # 🎓 INTERVIEW: This creates the "Authorize" button in Swagger UI
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Loader options for the per-request user lookup
+# hashed_password is deferred: nothing downstream of the auth dependency
+# reads it, and it's the widest column on the row.
+_USER_LOAD_OPTIONS = [defer(User.hashed_password)]
+
+# user_id -> column values of the User row (cache-aside, 5s TTL)
+# 🎓 INTERVIEW: We cache plain values, not the ORM object - an instance
+# can only belong to one session, and each request has its own session.
+# No lock needed: nothing is awaited between a cache lookup and store.
+# The short TTL still absorbs request bursts from one client, while
+# bounding staleness for changes made outside this process (e.g. an
+# account deactivated directly in the DB). Changes made through the
+# API call invalidate_user() right away.
+_user_cache: TTLCache[int, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=5)
+
+# user_id -> is_active, for POST /auth/refresh (a missing user is cached
+# as inactive). Refreshes are rarer than authenticated requests, so a
+# longer TTL is fine; API-side changes invalidate it like _user_cache.
+user_active_cache: TTLCache[int, bool] = TTLCache(maxsize=4096, ttl=60)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a cached user; call after the user row changes or is deleted."""
+    _user_cache.pop(user_id, None)
+    user_active_cache.pop(user_id, None)
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
@@ -54,6 +82,7 @@ async def get_current_user(
     Time Complexity:
     - Token decode: O(1) - just signature verification
     - DB lookup: O(log n) - indexed by user ID
+    - Cache hit: O(1) - no DB round trip at all
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -67,23 +96,36 @@ async def get_current_user(
         raise credentials_exception
     
     # Check token type
-    if payload.get("type") != "access":
+    if not has_token_type(payload, "access"):
         raise credentials_exception
     
-    # Extract user ID
+    # Extract user ID (already an int - see decode_token)
     user_id = payload.get("sub")
     if user_id is None:
         raise credentials_exception
     
+    # Serve from cache: rebuild the User and attach it to this
+    # request's session without emitting any SQL
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        user = User(**cached)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+    
     # Fetch user from database
-    result = await db.execute(
-        select(User).where(User.id == int(user_id))
-    )
-    user = result.scalar_one_or_none()
+    # 🎓 INTERVIEW: db.get() is a primary-key lookup that checks the
+    # session's identity map first - no SQL if the user is already loaded
+    user = await db.get(User, user_id, options=_USER_LOAD_OPTIONS)
     
     if user is None:
         raise credentials_exception
     
+    unloaded = inspect(user).unloaded  # e.g. the deferred hashed_password
+    _user_cache[user_id] = {
+        attr.key: getattr(user, attr.key)
+        for attr in User.__mapper__.column_attrs
+        if attr.key not in unloaded
+    }
     return user
 
 
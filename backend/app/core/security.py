@@ -7,7 +7,7 @@ Security utilities: Password hashing and JWT tokens.
 - Authorization: "What can you do?" (handled by roles/permissions)
 
 This module handles Authentication. We use:
-1. bcrypt for password hashing (one-way, with salt)
+1. argon2id for password hashing (one-way, with salt)
 2. JWT (JSON Web Tokens) for stateless auth
 
 🎓 Why Stateless JWT over Sessions?
@@ -17,33 +17,64 @@ This module handles Authentication. We use:
 - Trade-off: Can't invalidate tokens easily (use short expiry + refresh tokens)
 """
 
-from datetime import datetime, timedelta, timezone
+import hashlib
+import hmac
+import threading
+import time
+from datetime import timedelta
 from typing import Any
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import TTLCache
+from jwt import PyJWTError as JWTError
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# Hot token settings bound once at import (skips attribute lookups per call)
+_JWT_KEY = settings.JWT_SECRET.encode()  # HMAC key bytes, encoded once
+_JWT_ALG = settings.JWT_ALGORITHM
+_JWT_ALGS = [settings.JWT_ALGORITHM]
+_ACCESS_TTL_S = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TTL_S = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
 # Password hashing context
-# 🎓 INTERVIEW: bcrypt automatically handles salting
+# 🎓 INTERVIEW: argon2id (like bcrypt) automatically handles salting
 # Salt = random data added before hashing to prevent rainbow table attacks
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id; bcrypt stays listed (and marked deprecated)
+# so passwords hashed before the switch still verify.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__rounds=2,
+    argon2__memory_cost=19456,  # KiB (19 MiB)
+    argon2__parallelism=1,
+)
+
+# Decoded JWT payloads, keyed by a digest of the raw token
+# 🎓 INTERVIEW: A polling client sends the same token over and over.
+# Its signature only needs verifying once; later requests reuse the
+# payload. Entries expire after 30s and are re-checked against "exp".
+_decode_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=30)
+_decode_cache_lock = threading.Lock()
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using argon2id.
     
-    🎓 INTERVIEW CONCEPT: Why bcrypt?
+    🎓 INTERVIEW CONCEPT: Why argon2id?
     1. Intentionally slow (prevents brute force attacks)
-    2. Built-in salting (each hash is unique even for same password)
-    3. Configurable work factor (can increase as hardware improves)
+    2. Memory-hard (GPUs/ASICs can't cheaply parallelize guesses)
+    3. Built-in salting (each hash is unique even for same password)
+    4. Configurable cost (time, memory, parallelism)
     
-    Time Complexity: O(2^work_factor) - intentionally expensive!
-    Default work factor = 12, meaning 2^12 = 4096 iterations
+    This is blocking CPU work (tens of ms). From async routes, call it
+    via asyncio.to_thread() so the event loop keeps serving requests;
+    argon2-cffi releases the GIL while hashing.
     """
     return pwd_context.hash(password)
 
@@ -55,10 +86,27 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     🎓 SECURITY NOTE: This uses constant-time comparison
     to prevent timing attacks (attacker can't determine
     how many characters matched based on response time).
+    
+    Like hash_password, call via asyncio.to_thread() from async code.
     """
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password and rehash it if its hash is outdated.
+    
+    Returns (verified, new_hash). new_hash is set only when the password
+    matched AND the stored hash uses a deprecated scheme or settings
+    (e.g. a pre-argon2id bcrypt hash); the caller should save it.
+    
+    Like verify_password, call via asyncio.to_thread() from async code.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def create_access_token(
     subject: str | int,
     expires_delta: timedelta | None = None,
@@ -84,17 +132,18 @@ def create_access_token(
         expires_delta: How long until token expires
         extra_claims: Additional data to include in token
     """
+    # 🎓 INTERVIEW: JWT times are plain epoch seconds (RFC 7519), so we
+    # read the clock once and skip building datetime objects entirely
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = now + _ACCESS_TTL_S
     
     to_encode = {
         "sub": str(subject),
         "exp": expire,
-        "iat": datetime.now(timezone.utc),  # Issued at
+        "iat": now,  # Issued at
         "type": "access",
     }
     
@@ -103,8 +152,8 @@ def create_access_token(
     
     return jwt.encode(
         to_encode,
-        settings.JWT_SECRET,
-        algorithm=settings.JWT_ALGORITHM,
+        _JWT_KEY,
+        algorithm=_JWT_ALG,
     )
 
 
@@ -124,24 +173,32 @@ def create_refresh_token(subject: str | int) -> str:
     3. Refresh tokens can be stored more securely (httpOnly cookies)
     4. Can implement token rotation (new refresh token on each refresh)
     """
-    expire = datetime.now(timezone.utc) + timedelta(
-        days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-    )
+    now = int(time.time())
     
     to_encode = {
         "sub": str(subject),
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + _REFRESH_TTL_S,
+        "iat": now,
         "type": "refresh",
     }
     
     return jwt.encode(
         to_encode,
-        settings.JWT_SECRET,
-        algorithm=settings.JWT_ALGORITHM,
+        _JWT_KEY,
+        algorithm=_JWT_ALG,
     )
 
 
+def has_token_type(payload: dict[str, Any], expected: str) -> bool:
+    """
+    Check a decoded token's "type" claim ("access" or "refresh").
+    
+    Constant-time compare, used by every token check so access and
+    refresh validation can't drift apart.
+    """
+    return hmac.compare_digest(str(payload.get("type", "")), expected)
+
+
 def decode_token(token: str) -> dict[str, Any] | None:
     """
     Decode and validate a JWT token.
@@ -151,13 +208,37 @@ def decode_token(token: str) -> dict[str, Any] | None:
     🎓 INTERVIEW: This performs signature verification
     If someone tampers with the payload, the signature
     won't match and decoding will fail.
+    
+    Successful decodes are cached for a short time (see _decode_cache);
+    failures are never cached.
+    
+    The "sub" claim stays a string on the wire (RFC 7519 says StringOrURI,
+    and strict validators reject numbers), but the returned payload holds
+    it as an int user ID: parsed once here, then served from the cache.
     """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    with _decode_cache_lock:
+        cached = _decode_cache.get(key)
+    if cached is not None and cached["exp"] > time.time():
+        return cached
+    
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
+            _JWT_KEY,
+            algorithms=_JWT_ALGS,
+            # Reject tokens missing our claims inside the decoder itself
+            options={"require": ["exp", "sub", "type"]},
         )
-        return payload
     except JWTError:
         return None
+    
+    try:
+        payload["sub"] = int(payload["sub"])
+    except (TypeError, ValueError):
+        return None
+    
+    with _decode_cache_lock:
+        _decode_cache[key] = payload
+    return payload
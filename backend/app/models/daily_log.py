@@ -17,8 +17,13 @@ Key design decisions:
 from datetime import datetime, date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Integer, Float, Date, DateTime, ForeignKey, Text, func, UniqueConstraint
+from sqlalchemy import (
+    String, Integer, Float, Date, DateTime, ForeignKey, Index, Text, func,
+    UniqueConstraint, Computed, column,
+)
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.core.database import Base
 
@@ -26,6 +31,30 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 
+class seconds_between(FunctionElement):
+    """
+    Whole seconds from `start` to `end`: seconds_between(end, start).
+    
+    Compiled per dialect so the generated duration column below works on
+    both Postgres and the SQLite dev database.
+    """
+    type = Integer()
+    name = "seconds_between"
+    inherit_cache = True
+
+
+@compiles(seconds_between)
+def _seconds_between_default(element, compiler, **kw):
+    end, start = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"CAST(EXTRACT(EPOCH FROM {end} - {start}) AS INTEGER)"
+
+
+@compiles(seconds_between, "sqlite")
+def _seconds_between_sqlite(element, compiler, **kw):
+    end, start = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"CAST((julianday({end}) - julianday({start})) * 86400 AS INTEGER)"
+
+
 class DailyLog(Base):
     """
     A daily log entry - the "container" for a specific date.
@@ -69,24 +98,26 @@ class DailyLog(Base):
     )
     
     # Relationships
+    # 🎓 INTERVIEW: No lazy="selectin" on the child collections - a
+    # calendar/list query shouldn't fire extra SELECTs for children it
+    # never reads. Detail queries opt in at the call site:
+    #   select(DailyLog).options(
+    #       selectinload(DailyLog.workout_sessions)
+    #       .selectinload(WorkoutSession.completed_sets)
+    #   )
     user: Mapped["User"] = relationship("User", back_populates="daily_logs")
     
     workout_sessions: Mapped[list["WorkoutSession"]] = relationship(
         "WorkoutSession",
         back_populates="daily_log",
         cascade="all, delete-orphan",
-        lazy="selectin",
     )
     
     nutrition_logs: Mapped[list["NutritionLog"]] = relationship(
         "NutritionLog",
         back_populates="daily_log",
         cascade="all, delete-orphan",
-        lazy="selectin",
     )
-    
-    def __repr__(self) -> str:
-        return f"<DailyLog(id={self.id}, date={self.log_date})>"
 
 
 class WorkoutSession(Base):
@@ -122,7 +153,17 @@ class WorkoutSession(Base):
     # Session timing
     started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     ended_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # 🎓 INTERVIEW: A generated (computed) column - the DB derives it from
+    # started_at/ended_at on every write, so it can never drift out of
+    # sync and the app never writes it. NULL while the session is open.
+    duration_seconds: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed(
+            seconds_between(column("ended_at"), column("started_at")),
+            persisted=True,
+        ),
+        nullable=True,
+    )
     
     # Session notes
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -137,11 +178,7 @@ class WorkoutSession(Base):
         "CompletedSet",
         back_populates="workout_session",
         cascade="all, delete-orphan",
-        lazy="selectin",
     )
-    
-    def __repr__(self) -> str:
-        return f"<WorkoutSession(id={self.id}, routine='{self.routine_name}')>"
 
 
 class CompletedSet(Base):
@@ -163,17 +200,25 @@ class CompletedSet(Base):
     
     __tablename__ = "completed_sets"
     
+    # 🎓 INDEX: Composite (filter column, completed_at) indexes serve both
+    # the WHERE and the ORDER BY completed_at, so "last bench press set"
+    # is an index seek instead of fetching every match and sorting.
+    # Their leading columns also cover plain exercise_name /
+    # workout_session_id lookups, so no single-column indexes are needed.
+    __table_args__ = (
+        Index("ix_set_exercise_time", "exercise_name", "completed_at"),
+        Index("ix_set_log_time", "workout_session_id", "completed_at"),
+    )
+    
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     
     workout_session_id: Mapped[int] = mapped_column(
         ForeignKey("workout_sessions.id", ondelete="CASCADE"),
-        index=True,
     )
     
     # Exercise identification
     exercise_name: Mapped[str] = mapped_column(
         String(100),
-        index=True,  # 🎓 INDEX: Fast lookups for "history of bench press"
         nullable=False,
     )
     
@@ -199,9 +244,6 @@ class CompletedSet(Base):
         "WorkoutSession",
         back_populates="completed_sets",
     )
-    
-    def __repr__(self) -> str:
-        return f"<CompletedSet(exercise='{self.exercise_name}', reps={self.reps_completed})>"
 
 
 class NutritionLog(Base):
@@ -255,6 +297,3 @@ class NutritionLog(Base):
         "DailyLog",
         back_populates="nutrition_logs",
     )
-    
-    def __repr__(self) -> str:
-        return f"<NutritionLog(id={self.id}, calories={self.calories})>"
@@ -14,7 +14,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Enum as SQLEnum, Text, func
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Index, Enum as SQLEnum, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -49,22 +49,41 @@ class Routine(Base):
     
     __tablename__ = "routines"
     
+    # 🎓 INDEX: "This user's routines (for a given day)" is the hot query.
+    # A composite (user_id, day_of_week) index seeks straight to them,
+    # and its leading column still serves plain user_id lookups.
+    # It's UNIQUE to enforce one scheduled routine per day. NULLs never
+    # collide in a unique index, so unscheduled routines are unlimited -
+    # the same rule as a partial index WHERE day_of_week IS NOT NULL,
+    # without losing index coverage for the unscheduled rows.
+    __table_args__ = (
+        Index("ux_routines_user_day", "user_id", "day_of_week", unique=True),
+    )
+    
+    # Fetch created_at/updated_at via RETURNING during the INSERT flush,
+    # so create_routine can respond without a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     
     # Foreign Key to User
     # 🎓 INTERVIEW: Foreign keys enforce referential integrity at DB level
     # If you try to create a routine for non-existent user, DB rejects it
     user_id: Mapped[int] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"),
-        index=True,  # Index for faster user -> routines queries
+        ForeignKey("users.id", ondelete="CASCADE"),  # Indexed via ux_routines_user_day
     )
     
     # Routine metadata
     name: Mapped[str] = mapped_column(String(100), nullable=False)
-    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # 🎓 deferred: TEXT is left out of SELECTs unless asked for with
+    # undefer() - most queries never show it
+    description: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
     
     # Schedule - which day this routine is assigned to
     day_of_week: Mapped[DayOfWeek | None] = mapped_column(
+        # Kept as a native enum: a SMALLINT column would need a data
+        # migration for existing databases, and there are no Alembic
+        # revisions to carry one yet.
         SQLEnum(DayOfWeek),
         nullable=True,  # Routine might not be scheduled yet
     )
@@ -74,25 +93,30 @@ class Routine(Base):
         DateTime(timezone=True),
         server_default=func.now(),
     )
+    # No onupdate: update_routine bumps this explicitly, only when the
+    # routine's own columns change (exercise edits leave it alone)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
     )
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="routines")
     
+    # 🎓 INTERVIEW: lazy="raise_on_sql" means "never load implicitly".
+    # Endpoints that need exercises ask via selectinload(); everyone else
+    # (list, rename, delete) skips the extra query - and forgetting the
+    # option fails loudly instead of silently adding an N+1.
+    # passive_deletes lets the FK's ON DELETE CASCADE remove exercises
+    # rather than loading them just to delete them.
     exercises: Mapped[list["RoutineExercise"]] = relationship(
         "RoutineExercise",
         back_populates="routine",
         cascade="all, delete-orphan",
         order_by="RoutineExercise.order",  # Maintain exercise order
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
-    
-    def __repr__(self) -> str:
-        return f"<Routine(id={self.id}, name='{self.name}')>"
 
 
 class RoutineExercise(Base):
@@ -111,12 +135,18 @@ class RoutineExercise(Base):
     
     __tablename__ = "routine_exercises"
     
+    # 🎓 INDEX: Exercises are always fetched as
+    # WHERE routine_id IN (...) ORDER BY "order", so an index on
+    # (routine_id, order) covers both the filter and the sort.
+    __table_args__ = (
+        Index("ix_routine_exercises_routine_order", "routine_id", "order"),
+    )
+    
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     
-    # Which routine this belongs to
+    # Which routine this belongs to (indexed via the composite index above)
     routine_id: Mapped[int] = mapped_column(
         ForeignKey("routines.id", ondelete="CASCADE"),
-        index=True,
     )
     
     # Exercise details
@@ -131,14 +161,11 @@ class RoutineExercise(Base):
     # 🎓 INTERVIEW: Explicit ordering allows drag-and-drop reordering
     order: Mapped[int] = mapped_column(Integer, default=0)
     
-    # Optional notes (e.g., "Use slow negatives")
-    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Optional notes (e.g., "Use slow negatives"); deferred like Routine.description
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
     
     # Relationship back to routine
     routine: Mapped["Routine"] = relationship(
         "Routine",
         back_populates="exercises",
     )
-    
-    def __repr__(self) -> str:
-        return f"<RoutineExercise(id={self.id}, name='{self.exercise_name}')>"
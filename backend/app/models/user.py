@@ -14,7 +14,7 @@ The User table is the "root" entity - other tables reference it via foreign keys
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Boolean, DateTime, func
+from sqlalchemy import String, Boolean, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -36,6 +36,20 @@ class User(Base):
     
     __tablename__ = "users"
     
+    # 🎓 INDEX: Covering index for login. Postgres stores the INCLUDE
+    # columns in the index leaf pages, so "SELECT id, hashed_password,
+    # is_active WHERE email = ?" is an index-only scan (no heap visit).
+    # It's also the UNIQUE index behind email. Other dialects ignore
+    # postgresql_include and get a plain unique index on email.
+    __table_args__ = (
+        Index(
+            "ix_users_email_cover",
+            "email",
+            unique=True,
+            postgresql_include=["id", "hashed_password", "is_active"],
+        ),
+    )
+    
     # Primary Key
     # 🎓 INTERVIEW: Integer PKs are faster for joins than UUIDs
     # but UUIDs are better for distributed systems (no coordination needed)
@@ -44,9 +58,7 @@ class User(Base):
     # Authentication fields
     email: Mapped[str] = mapped_column(
         String(255),
-        unique=True,
-        index=True,  # 🎓 INDEX: O(log n) lookups vs O(n) table scan
-        nullable=False,
+        nullable=False,  # 🎓 INDEX: unique via ix_users_email_cover - O(log n) lookups
     )
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     
@@ -80,19 +92,24 @@ class User(Base):
     # 🎓 INTERVIEW CONCEPT: One-to-Many Relationship
     # One User has Many Routines, One User has Many DailyLogs
     # back_populates creates bidirectional navigation
+    #
+    # lazy="raise_on_sql": the auth dependency loads a User on every
+    # request and almost no endpoint reads these collections, so they
+    # are never loaded implicitly - use selectinload() where needed.
+    # passive_deletes: on user delete, the FKs' ON DELETE CASCADE removes
+    # the children instead of the ORM loading them first.
     routines: Mapped[list["Routine"]] = relationship(
         "Routine",
         back_populates="user",
         cascade="all, delete-orphan",  # Delete routines when user is deleted
-        lazy="selectin",  # Efficient async loading strategy
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     
     daily_logs: Mapped[list["DailyLog"]] = relationship(
         "DailyLog",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
-    
-    def __repr__(self) -> str:
-        return f"<User(id={self.id}, username='{self.username}')>"
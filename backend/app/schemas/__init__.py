@@ -16,6 +16,8 @@ from app.schemas.routine import (
     RoutineExerciseCreate,
     RoutineExerciseUpdate,
     RoutineExerciseResponse,
+    RoutineExerciseUpsert,
+    ExerciseOrder,
 )
 
 __all__ = [
@@ -34,4 +36,16 @@ __all__ = [
     "RoutineExerciseCreate",
     "RoutineExerciseUpdate",
     "RoutineExerciseResponse",
+    "RoutineExerciseUpsert",
+    "ExerciseOrder",
 ]
+
+# Finish building every exported schema now, at import time.
+# 🎓 INTERVIEW: Pydantic v2 compiles a model's validator when the class
+# is defined, unless an annotation can't be resolved yet (a forward
+# reference); such a model is compiled on first use - i.e. in a request.
+# model_rebuild() is a no-op for complete models and otherwise moves
+# that work (or the error) to startup.
+for _name in __all__:
+    globals()[_name].model_rebuild()
+del _name
@@ -17,7 +17,8 @@ Example: Creating a routine with its exercises:
 """
 
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 from app.models.routine import DayOfWeek
 
@@ -47,6 +48,21 @@ class RoutineExerciseUpdate(BaseModel):
     notes: str | None = None
 
 
+class RoutineExerciseUpsert(RoutineExerciseBase):
+    """
+    One entry of a full exercise-list replace.
+    
+    With an id, updates that exercise; without, creates a new one.
+    """
+    id: int | None = None
+
+
+class ExerciseOrder(BaseModel):
+    """One entry of a bulk reorder (e.g. after drag-and-drop)."""
+    id: int
+    order: int = Field(ge=0)
+
+
 class RoutineExerciseResponse(RoutineExerciseBase):
     """Schema for exercise in API responses."""
     id: int
@@ -78,6 +94,14 @@ class RoutineUpdate(BaseModel):
     name: str | None = Field(default=None, max_length=100)
     description: str | None = None
     day_of_week: DayOfWeek | None = None
+    
+    @field_validator("name")
+    @classmethod
+    def name_not_null(cls, name: str | None) -> str:
+        """name may be left out, but not set to null (the column is NOT NULL)."""
+        if name is None:
+            raise ValueError("name cannot be null")
+        return name
 
 
 class RoutineResponse(RoutineBase):
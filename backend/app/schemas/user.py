@@ -19,17 +19,32 @@ Why separate Pydantic schemas from SQLAlchemy models?
 """
 
 from datetime import datetime
+
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
 
-class UserBase(BaseModel):
-    """Base schema with common fields."""
+class UserWriteBase(BaseModel):
+    """Common fields for inbound (client-supplied) user data."""
     email: EmailStr
     username: str = Field(min_length=3, max_length=50)
     full_name: str | None = None
 
 
-class UserCreate(UserBase):
+class UserReadBase(BaseModel):
+    """
+    Common fields for outbound user data.
+    
+    🎓 INTERVIEW: email is a plain str here. EmailStr runs the full
+    email-validator check (syntax, IDNA, ...) on every instantiation,
+    and these schemas are built from DB rows on almost every request.
+    Stored emails already passed EmailStr on the way in.
+    """
+    email: str
+    username: str
+    full_name: str | None = None
+
+
+class UserCreate(UserWriteBase):
     """
     Schema for user registration.
     
@@ -56,7 +71,7 @@ class UserUpdate(BaseModel):
     password: str | None = Field(default=None, min_length=8, max_length=100)
 
 
-class UserResponse(UserBase):
+class UserResponse(UserReadBase):
     """
     Schema for API responses.
     
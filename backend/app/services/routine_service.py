@@ -0,0 +1,156 @@
+"""
+Routine Services - Multi-row operations on routines and their exercises.
+
+🎓 INTERVIEW CONCEPT: ORM vs Core for bulk writes
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Reordering through the ORM means loading every RoutineExercise,
+setting .order on each, and letting flush emit one UPDATE per row
+(plus identity-map bookkeeping for every object).
+
+A Core UPDATE with bound parameters and a list of values runs as
+a single executemany: one compiled statement, one round trip, and
+no objects materialized at all. Replacing a whole exercise list works
+the same way: a fixed number of batched statements, not one per row.
+"""
+
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import RoutineExercise
+from app.schemas import RoutineExerciseUpsert
+
+# Built once at import; b_id/b_order are bound per row.
+# (Named differently from the columns: Core reserves the column names
+# for the SET values.)
+_exercises = RoutineExercise.__table__
+_REORDER_EXERCISES = (
+    update(_exercises)
+    .where(
+        _exercises.c.id == bindparam("b_id"),
+        _exercises.c.routine_id == bindparam("b_routine_id"),
+    )
+    .values(order=bindparam("b_order"))
+)
+
+# Client-editable exercise columns (everything but id/routine_id)
+_EXERCISE_FIELDS = (
+    "exercise_name",
+    "target_sets",
+    "target_reps",
+    "target_weight",
+    "order",
+    "notes",
+)
+_UPDATE_EXERCISE = (
+    update(_exercises)
+    .where(
+        _exercises.c.id == bindparam("b_id"),
+        _exercises.c.routine_id == bindparam("b_routine_id"),
+    )
+    .values({name: bindparam(f"b_{name}") for name in _EXERCISE_FIELDS})
+)
+
+
+async def reorder_exercises(
+    db: AsyncSession,
+    routine_id: int,
+    pairs: list[tuple[int, int]],
+) -> None:
+    """
+    Set the display order of many exercises in one statement.
+
+    Args:
+        routine_id: Routine the exercises belong to. Ownership must be
+            checked by the caller; ids from other routines are ignored.
+        pairs: (exercise_id, order) tuples.
+
+    Does not commit. Exercise objects already loaded in the session
+    are not updated - reload them if the new order is needed.
+    """
+    if not pairs:
+        return
+
+    # Executed on the session's connection: an ORM-enabled update()
+    # with a parameter list would switch to "bulk UPDATE by primary
+    # key" and reject the custom WHERE clause.
+    conn = await db.connection()
+    await conn.execute(
+        _REORDER_EXERCISES,
+        [
+            {"b_id": exercise_id, "b_routine_id": routine_id, "b_order": order}
+            for exercise_id, order in pairs
+        ],
+    )
+
+
+async def replace_exercises(
+    db: AsyncSession,
+    routine_id: int,
+    exercises: list[RoutineExerciseUpsert],
+) -> None:
+    """
+    Make a routine's exercises match the given list.
+
+    Entries with an id update that exercise in place, entries without
+    one are inserted, and exercises missing from the list are deleted.
+    That's at most four statements (id check, DELETE, executemany
+    UPDATE, executemany INSERT) whatever the list size - the diff happens in
+    the database, and kept exercises keep their ids.
+
+    Routine ownership must be checked by the caller. Raises LookupError
+    (before changing anything) if an id isn't an exercise of this
+    routine. Does not commit.
+    """
+    # Entries that don't set an order get their list position, so the
+    # client's list order is kept for new and existing exercises alike
+    exercises = [
+        e if "order" in e.model_fields_set else e.model_copy(update={"order": i})
+        for i, e in enumerate(exercises)
+    ]
+    kept = [e for e in exercises if e.id is not None]
+    new = [e for e in exercises if e.id is None]
+
+    conn = await db.connection()
+    if kept:
+        # Stale or foreign ids would otherwise only show up after the
+        # DELETE below had already removed the routine's real exercises
+        kept_ids = {e.id for e in kept}
+        result = await conn.execute(
+            select(_exercises.c.id).where(
+                _exercises.c.routine_id == routine_id,
+                _exercises.c.id.in_(kept_ids),
+            )
+        )
+        unknown = kept_ids - set(result.scalars())
+        if unknown:
+            raise LookupError(f"Exercises not in routine {routine_id}: {sorted(unknown)}")
+
+    await conn.execute(
+        delete(_exercises).where(
+            _exercises.c.routine_id == routine_id,
+            _exercises.c.id.not_in([e.id for e in kept]),
+        )
+    )
+    if kept:
+        await conn.execute(
+            _UPDATE_EXERCISE,
+            [
+                {
+                    "b_id": e.id,
+                    "b_routine_id": routine_id,
+                    **{f"b_{name}": getattr(e, name) for name in _EXERCISE_FIELDS},
+                }
+                for e in kept
+            ],
+        )
+    if new:
+        await conn.execute(
+            insert(_exercises),
+            [
+                {
+                    "routine_id": routine_id,
+                    **{name: getattr(e, name) for name in _EXERCISE_FIELDS},
+                }
+                for e in new
+            ],
+        )
@@ -0,0 +1,48 @@
+"""
+Shared test fixtures.
+
+Tests run against an in-memory SQLite database (see core/database.py:
+StaticPool keeps it alive for the whole run). DATABASE_URL must be set
+before anything imports app.core.config.
+"""
+
+import os
+
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite://"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """App client; entering it runs the lifespan (create_all)."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def tokens(client, request):
+    """Register a fresh user (unique per test) and log in; returns the Token body."""
+    name = request.node.name.replace("_", "")[:40]
+    email = f"{name}@example.com"
+    password = "password123"
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"email": email, "username": name, "password": password},
+    )
+    assert response.status_code == 201, response.text
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": email, "password": password},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.fixture
+def auth_headers(tokens):
+    """Authorization header for the fresh user from `tokens`."""
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
@@ -0,0 +1,81 @@
+"""
+Tests for the Postgres json_agg path of GET /routines/{id}.
+
+The suite runs on SQLite, which takes the selectinload path. Set
+TEST_POSTGRES_URL (postgresql+asyncpg://...) to a throwaway database
+to also run the json_agg query and compare it with that path.
+"""
+
+import os
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.v1.endpoints.routines import (
+    _GET_ROUTINE_NESTED,
+    _ROUTINE_DETAIL_OPTIONS,
+    get_routine,
+)
+from app.core.database import Base
+from app.models import DayOfWeek, Routine, RoutineExercise, User
+from app.schemas import RoutineResponse
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+def test_nested_query_binds_json_keys():
+    """JSON keys are bound parameters, never SQL text."""
+    compiled = _GET_ROUTINE_NESTED.compile(dialect=asyncpg.dialect())
+    assert "'exercise_name'" not in str(compiled)
+    assert "exercise_name" in compiled.params.values()
+
+
+@pytest.mark.skipif(POSTGRES_URL is None, reason="TEST_POSTGRES_URL not set")
+@pytest.mark.asyncio
+async def test_json_agg_matches_orm_path():
+    engine = create_async_engine(POSTGRES_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            user = User(email="pg@example.com", username="pg", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            routine = Routine(
+                user_id=user.id,
+                name="Push",
+                description="Chest and shoulders",
+                day_of_week=DayOfWeek.MONDAY,
+            )
+            empty = Routine(user_id=user.id, name="Empty")
+            db.add_all([routine, empty])
+            await db.flush()
+            db.add_all([
+                RoutineExercise(routine_id=routine.id, exercise_name="Dips", order=1),
+                RoutineExercise(
+                    routine_id=routine.id,
+                    exercise_name="Bench",
+                    order=0,
+                    target_weight=80.5,
+                    notes="Pause reps",
+                ),
+            ])
+            await db.commit()
+            routine_ids = (routine.id, empty.id)
+            db.expunge_all()  # Load fresh from the DB below
+            
+            for routine_id in routine_ids:
+                nested = RoutineResponse.model_validate(
+                    await get_routine(routine_id, user, db)
+                )
+                loaded = RoutineResponse.model_validate(
+                    await db.get(Routine, routine_id, options=_ROUTINE_DETAIL_OPTIONS)
+                )
+                assert nested == loaded
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
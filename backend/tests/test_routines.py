@@ -0,0 +1,210 @@
+"""Tests for the routine endpoints."""
+
+
+def test_replace_exercises_keeps_list_order(client, auth_headers):
+    """Entries without an explicit order take their list position."""
+    response = client.post(
+        "/api/v1/routines/",
+        json={
+            "name": "Push Day",
+            "exercises": [
+                {"exercise_name": "Bench Press"},
+                {"exercise_name": "Dips"},
+                {"exercise_name": "Flyes"},
+            ],
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 201, response.text
+    routine = response.json()
+    bench, dips, flyes = routine["exercises"]
+
+    response = client.put(
+        f"/api/v1/routines/{routine['id']}/exercises",
+        json=[
+            {"exercise_name": "Overhead Press"},
+            {"id": flyes["id"], "exercise_name": "Flyes"},
+            {"id": bench["id"], "exercise_name": "Bench Press", "target_sets": 5},
+        ],
+        headers=auth_headers,
+    )
+    assert response.status_code == 200, response.text
+    exercises = response.json()
+
+    assert [e["exercise_name"] for e in exercises] == [
+        "Overhead Press",
+        "Flyes",
+        "Bench Press",
+    ]
+    assert [e["order"] for e in exercises] == [0, 1, 2]
+    # Kept exercises keep their ids and take the new values
+    assert exercises[1]["id"] == flyes["id"]
+    assert exercises[2]["id"] == bench["id"]
+    assert exercises[2]["target_sets"] == 5
+    # Exercises missing from the list are deleted
+    assert dips["id"] not in {e["id"] for e in exercises}
+
+    response = client.get(f"/api/v1/routines/{routine['id']}", headers=auth_headers)
+    assert [e["exercise_name"] for e in response.json()["exercises"]] == [
+        "Overhead Press",
+        "Flyes",
+        "Bench Press",
+    ]
+
+
+def test_replace_exercises_keeps_explicit_order_zero(client, auth_headers):
+    response = client.post(
+        "/api/v1/routines/",
+        json={
+            "name": "Pull Day",
+            "exercises": [{"exercise_name": "Rows"}, {"exercise_name": "Curls"}],
+        },
+        headers=auth_headers,
+    )
+    routine = response.json()
+    rows, curls = routine["exercises"]
+
+    response = client.put(
+        f"/api/v1/routines/{routine['id']}/exercises",
+        json=[
+            {"id": rows["id"], "exercise_name": "Rows", "order": 1},
+            {"id": curls["id"], "exercise_name": "Curls", "order": 0},
+        ],
+        headers=auth_headers,
+    )
+    assert response.status_code == 200, response.text
+    assert [(e["id"], e["order"]) for e in response.json()] == [
+        (curls["id"], 0),
+        (rows["id"], 1),
+    ]
+
+
+def test_replace_exercises_unknown_id_changes_nothing(client, auth_headers):
+    response = client.post(
+        "/api/v1/routines/",
+        json={"name": "Arms", "exercises": [{"exercise_name": "Curls"}]},
+        headers=auth_headers,
+    )
+    routine = response.json()
+
+    response = client.put(
+        f"/api/v1/routines/{routine['id']}/exercises",
+        json=[{"id": 999999, "exercise_name": "Ghost"}],
+        headers=auth_headers,
+    )
+    assert response.status_code == 404
+
+    response = client.get(f"/api/v1/routines/{routine['id']}", headers=auth_headers)
+    assert response.json()["exercises"] == routine["exercises"]
+
+
+def test_replace_exercises_unknown_routine(client, auth_headers):
+    response = client.put(
+        "/api/v1/routines/999999/exercises",
+        json=[{"exercise_name": "Squat"}],
+        headers=auth_headers,
+    )
+    assert response.status_code == 404
+
+
+def test_second_routine_on_same_day_conflicts(client, auth_headers):
+    response = client.post(
+        "/api/v1/routines/",
+        json={"name": "Legs", "day_of_week": "monday"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201, response.text
+    routine_id = response.json()["id"]
+
+    response = client.post(
+        "/api/v1/routines/",
+        json={"name": "Back", "day_of_week": "monday"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 409
+
+    response = client.post(
+        "/api/v1/routines/",
+        json={"name": "Back", "day_of_week": "tuesday"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201, response.text
+
+    response = client.patch(
+        f"/api/v1/routines/{response.json()['id']}",
+        json={"day_of_week": "monday"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 409
+
+    response = client.get(
+        "/api/v1/routines/", params={"day_of_week": "monday"}, headers=auth_headers
+    )
+    assert [(r["name"], r["exercise_count"]) for r in response.json()] == [("Legs", 0)]
+
+    # name can be left out of a PATCH, but not set to null
+    response = client.patch(
+        f"/api/v1/routines/{routine_id}",
+        json={"name": None},
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+
+
+def test_reorder_exercises(client, auth_headers):
+    response = client.post(
+        "/api/v1/routines/",
+        json={
+            "name": "Full Body",
+            "exercises": [
+                {"exercise_name": "Squat"},
+                {"exercise_name": "Press"},
+                {"exercise_name": "Deadlift"},
+            ],
+        },
+        headers=auth_headers,
+    )
+    routine = response.json()
+    squat, press, deadlift = routine["exercises"]
+
+    # Another user's routine, whose exercise id we'll try to slip in
+    client.post(
+        "/api/v1/auth/register",
+        json={"email": "other@example.com", "username": "other", "password": "password123"},
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "other@example.com", "password": "password123"},
+    )
+    other_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = client.post(
+        "/api/v1/routines/",
+        json={"name": "Theirs", "exercises": [{"exercise_name": "Row", "order": 4}]},
+        headers=other_headers,
+    )
+    other_routine = response.json()
+    (other_exercise,) = other_routine["exercises"]
+
+    response = client.put(
+        f"/api/v1/routines/{routine['id']}/exercises/order",
+        json=[
+            {"id": deadlift["id"], "order": 0},
+            {"id": squat["id"], "order": 1},
+            {"id": press["id"], "order": 2},
+            {"id": other_exercise["id"], "order": 0},
+        ],
+        headers=auth_headers,
+    )
+    assert response.status_code == 204, response.text
+
+    response = client.get(f"/api/v1/routines/{routine['id']}", headers=auth_headers)
+    assert [e["id"] for e in response.json()["exercises"]] == [
+        deadlift["id"],
+        squat["id"],
+        press["id"],
+    ]
+
+    response = client.get(
+        f"/api/v1/routines/{other_routine['id']}", headers=other_headers
+    )
+    assert response.json()["exercises"] == [other_exercise]
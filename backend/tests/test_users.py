@@ -0,0 +1,37 @@
+"""Tests for the /users/me endpoints and the cached current-user lookup."""
+
+
+def test_update_is_visible_within_cache_ttl(client, auth_headers):
+    # Prime the user cache, then change the row through the API
+    response = client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["full_name"] is None
+
+    response = client.patch(
+        "/api/v1/users/me", json={"full_name": "Ada Lovelace"}, headers=auth_headers
+    )
+    assert response.status_code == 200, response.text
+
+    response = client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Ada Lovelace"
+
+
+def test_deleted_user_tokens_are_rejected(client, tokens, auth_headers):
+    # Prime both caches: the access-token user lookup and refresh's is_active
+    assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 200
+    response = client.post(
+        "/api/v1/auth/refresh", params={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 200
+
+    response = client.delete("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 204
+
+    response = client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 401
+
+    response = client.post(
+        "/api/v1/auth/refresh", params={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 401